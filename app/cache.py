@@ -0,0 +1,66 @@
+"""
+Query-result cache for Trident Energy Risk Manager API
+
+Backed by Redis when REDIS_URL is set (shared across uvicorn workers and
+surviving restarts), otherwise by in-process cachetools TTLCaches.
+"""
+
+import logging
+import os
+from decimal import Decimal
+
+import orjson
+from cachetools import TTLCache
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+log = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+_redis = aioredis.from_url(REDIS_URL) if (REDIS_URL and aioredis) else None
+
+# In-process fallback: one TTLCache per distinct TTL
+_local = {}
+
+
+def json_default(value):
+    """Serialize dates/decimals the connector returns as objects"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _local_cache(ttl):
+    cache = _local.get(ttl)
+    if cache is None:
+        cache = _local[ttl] = TTLCache(maxsize=256, ttl=ttl)
+    return cache
+
+
+async def cache_get(key, ttl):
+    """Return the cached value for key, or None on a miss"""
+    if _redis is not None:
+        try:
+            data = await _redis.get(key)
+            return orjson.loads(data) if data is not None else None
+        except Exception:
+            # Redis unavailable - fall through to the local cache
+            log.warning("Redis GET failed for %r, using local cache", key, exc_info=True)
+    return _local_cache(ttl).get(key)
+
+
+async def cache_set(key, value, ttl):
+    """Store value under key for ttl seconds"""
+    if _redis is not None:
+        try:
+            await _redis.setex(key, ttl, orjson.dumps(value, default=json_default))
+            return
+        except Exception:
+            log.warning("Redis SET failed for %r, using local cache", key, exc_info=True)
+    _local_cache(ttl)[key] = value
@@ -2,48 +2,79 @@
 Database connection module for Trident Energy Risk Manager API
 """
 
+import logging
 import os
-import mysql.connector
-from mysql.connector import Error
+
+import aiomysql
+
+log = logging.getLogger(__name__)
 
 # Database configuration from environment variables
 DB_CONFIG = {
     "host": os.getenv("DB_HOST", "sql7.freesqldatabase.com"),
-    "database": os.getenv("DB_NAME", "sql7812701"),
+    "db": os.getenv("DB_NAME", "sql7812701"),
     "user": os.getenv("DB_USER", "sql7812701"),
     "password": os.getenv("DB_PASSWORD", ""),  # Set this in Render environment variables
     "port": int(os.getenv("DB_PORT", "3306")),
     "charset": "utf8",
-    "use_unicode": True,
-    "get_warnings": True,
-    "raise_on_warnings": False,
-    "connection_timeout": 30
+    "connect_timeout": 30,
+    "autocommit": True
 }
 
+# Pool bounds, overridable via environment variables
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "5"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+
+# Module-level async connection pool, created on application startup
+_pool = None
+
+
+async def init_pool():
+    """Create the aiomysql connection pool (called on app startup)"""
+    global _pool
+    if _pool is None:
+        _pool = await aiomysql.create_pool(
+            minsize=DB_POOL_MIN,
+            maxsize=DB_POOL_SIZE,
+            **DB_CONFIG
+        )
+    return _pool
+
 
-def get_db_connection():
+async def close_pool():
+    """Close the connection pool (called on app shutdown)"""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        await _pool.wait_closed()
+        _pool = None
+
+
+def get_pool():
+    """Return the active pool (init_pool must have run)"""
+    if _pool is None:
+        raise RuntimeError("Database pool is not initialized")
+    return _pool
+
+
+async def get_db_cursor():
     """
-    Create and return a database connection.
-    Connection should be closed after use.
+    FastAPI dependency yielding a dict cursor on a pooled connection.
+    The connection is returned to the pool when the request finishes.
     """
-    try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        if connection.is_connected():
-            return connection
-    except Error as e:
-        print(f"Error connecting to MySQL database: {e}")
-        raise Exception(f"Database connection failed: {e}")
+    async with get_pool().acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            yield cursor
 
 
-def test_connection():
+async def test_connection():
     """Test the database connection"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        async with get_pool().acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT 1")
+                await cursor.fetchone()
         return {"status": "success", "message": "Database connection successful"}
     except Exception as e:
+        log.exception("Database connection test failed")
         return {"status": "error", "message": str(e)}
@@ -3,13 +3,24 @@ Trident Energy Global Risk Manager API
 FastAPI application for querying the risk management database
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.cors import ALL_METHODS
 from typing import List, Optional
+import asyncio
+import hashlib
+import logging
 import os
 from datetime import datetime
+from urllib.parse import urlencode
 
-from .database import get_db_connection
+import aiomysql
+import orjson
+
+from .cache import cache_get, cache_set, json_default
+from .database import init_pool, close_pool, get_db_cursor, get_pool
 from .models import (
     User, UserCreate, UserResponse,
     Risk, RiskResponse,
@@ -17,15 +28,120 @@ from .models import (
     ActionPlan, Control, Comment
 )
 
+log = logging.getLogger(__name__)
+
 # Create FastAPI app
 app = FastAPI(
     title="Trident Energy Risk Manager API",
     description="API para consulta do sistema de gestão de riscos da Trident Energy",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
+# Cache windows: near-static lookup tables for 5 minutes, aggregate
+# summaries for 1 minute (see app.cache for the Redis/in-process backend)
+LOOKUP_TTL = 300
+SUMMARY_TTL = 60
+
+# Result sets larger than this are streamed instead of materialized
+STREAM_THRESHOLD = 1000
+STREAM_CHUNK_SIZE = 500
+
+
+def _add_owner_name(row):
+    row["owner_name"] = USER_NAMES.get(row["owner_id"])
+
+
+def _conditional_response(request, payload, max_age):
+    """
+    Serve a payload with ETag/Cache-Control headers, answering 304 Not
+    Modified when the client's If-None-Match still matches. Lets
+    browsers and proxies skip the full FastAPI+DB path on repeats.
+    """
+    body = orjson.dumps(payload, default=json_default)
+    etag = 'W/"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# id -> full_name map for decorating list rows without joining users;
+# loaded at startup and refreshed in the background
+USER_NAMES = {}
+USER_NAMES_REFRESH = 300
+
+_user_names_task = None
+
+
+async def _refresh_user_names():
+    """Reload the user-name map from the users table"""
+    async with get_pool().acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute("SELECT id, full_name FROM users")
+            rows = await cursor.fetchall()
+    USER_NAMES.clear()
+    USER_NAMES.update(dict(rows))
+
+
+async def _user_names_refresher():
+    while True:
+        await asyncio.sleep(USER_NAMES_REFRESH)
+        try:
+            await _refresh_user_names()
+        except Exception:
+            # Keep serving the previous map until the next attempt
+            log.exception("User-name map refresh failed")
+
+
+async def _fetch_one(query):
+    """Run a single-row query on its own pooled connection"""
+    async with get_pool().acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query)
+            return await cursor.fetchone()
+
+
+async def _fetch_all(query):
+    """
+    Run a query on a pooled connection held only for its duration - used
+    by the cached endpoints so cache hits never touch the pool.
+    """
+    async with get_pool().acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query)
+            return await cursor.fetchall()
+
+
+async def _stream_rows(query, params, decorate=None):
+    """
+    Yield a JSON array in chunks from an unbuffered server-side cursor,
+    keeping peak memory at O(chunk) instead of O(result set).
+    """
+    async with get_pool().acquire() as conn:
+        async with conn.cursor(aiomysql.SSDictCursor) as cursor:
+            await cursor.execute(query, params)
+            yield b"["
+            first = True
+            while True:
+                rows = await cursor.fetchmany(STREAM_CHUNK_SIZE)
+                if not rows:
+                    break
+                if decorate is not None:
+                    for row in rows:
+                        decorate(row)
+                body = orjson.dumps(rows, default=json_default)
+                if not first:
+                    yield b","
+                # Strip the chunk's surrounding brackets so the chunks
+                # concatenate into one array
+                yield body[1:-1]
+                first = False
+            yield b"]"
+
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +151,51 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip large JSON responses; the joined list payloads compress 5-10x
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Mirrors the CORSMiddleware configuration above for the fast path:
+# ALL_METHODS is what Starlette expands allow_methods=["*"] into, and
+# Vary: Origin matches what CORSMiddleware sends when echoing an
+# explicit allow-origin, so shared caches key preflights per origin
+_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Methods": ", ".join(ALL_METHODS),
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Max-Age": "600",
+    "Vary": "Origin",
+}
+
+
+# Registered after the add_middleware calls, so it sits outermost and
+# runs before CORS, gzip and route/dependency resolution
+@app.middleware("http")
+async def fast_preflight(request: Request, call_next):
+    """Short-circuit CORS preflights with precomputed headers"""
+    if request.method == "OPTIONS" and "access-control-request-method" in request.headers:
+        headers = dict(_PREFLIGHT_HEADERS)
+        headers["Access-Control-Allow-Origin"] = request.headers.get("origin", "*")
+        headers["Access-Control-Allow-Headers"] = request.headers.get(
+            "access-control-request-headers", "*")
+        return Response(status_code=204, headers=headers)
+    return await call_next(request)
+
+
+@app.on_event("startup")
+async def startup():
+    """Create the database connection pool and preload the user-name map"""
+    global _user_names_task
+    await init_pool()
+    await _refresh_user_names()
+    _user_names_task = asyncio.create_task(_user_names_refresher())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the database connection pool"""
+    if _user_names_task is not None:
+        _user_names_task.cancel()
+    await close_pool()
+
 
 # ============================================
 # ROOT ENDPOINT
@@ -61,28 +222,34 @@ def health_check():
 # USERS ENDPOINTS
 # ============================================
 
-@app.get("/api/users", response_model=List[UserResponse])
-def get_users(
+# response_model is skipped on the hot list endpoints: the rows come
+# straight from MySQL and re-validating every dict through Pydantic is
+# pure per-row overhead. The schema stays documented via `responses`.
+@app.get("/api/users", responses={200: {"model": List[UserResponse]}})
+async def get_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     role_id: Optional[int] = None,
     country_id: Optional[int] = None,
-    is_active: Optional[bool] = True
+    is_active: Optional[bool] = True,
+    after_name: Optional[str] = None,
+    after_id: Optional[int] = None,
+    cursor=Depends(get_db_cursor)
 ):
     """
     Get all users with optional filters
-    
-    - **skip**: Number of records to skip (pagination)
+
+    - **skip**: Number of records to skip (offset pagination)
     - **limit**: Maximum number of records to return
     - **role_id**: Filter by role ID
     - **country_id**: Filter by country ID
     - **is_active**: Filter by active status
+    - **after_name** / **after_id**: Keyset cursor (taken from the
+      X-Next-Cursor response header); preferred over skip for deep pages
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
     query = """
-        SELECT 
+        SELECT
             u.id,
             u.full_name,
             u.email,
@@ -102,39 +269,69 @@ def get_users(
         WHERE 1=1
     """
     params = []
-    
+
     if role_id is not None:
         query += " AND u.role_id = %s"
         params.append(role_id)
-    
+
     if country_id is not None:
         query += " AND u.country_id = %s"
         params.append(country_id)
-    
+
     if is_active is not None:
         query += " AND u.is_active = %s"
         params.append(1 if is_active else 0)
-    
-    query += " ORDER BY u.full_name LIMIT %s OFFSET %s"
-    params.extend([limit, skip])
-    
-    cursor.execute(query, params)
-    users = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
+
+    if after_name is not None and after_id is not None:
+        # Keyset pagination: O(limit) regardless of page depth
+        query += " AND (u.full_name, u.id) > (%s, %s)"
+        params.extend([after_name, after_id])
+        query += " ORDER BY u.full_name, u.id LIMIT %s"
+        params.append(limit)
+    else:
+        query += " ORDER BY u.full_name, u.id LIMIT %s OFFSET %s"
+        params.extend([limit, skip])
+
+    await cursor.execute(query, params)
+    users = await cursor.fetchall()
+
+    if len(users) == limit:
+        last = users[-1]
+        response.headers["X-Next-Cursor"] = urlencode(
+            {"after_name": last["full_name"], "after_id": last["id"]})
+
     return users
 
 
-@app.get("/api/users/{user_id}", response_model=UserResponse)
-def get_user(user_id: int):
-    """Get a specific user by ID"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    query = """
-        SELECT 
+# Registered before /api/users/{user_id} so the literal "count" segment
+# is not swallowed by the parameterized route
+@app.get("/api/users/count")
+async def get_users_count(cursor=Depends(get_db_cursor)):
+    """Get total count of users"""
+    # WITH ROLLUP appends a super-aggregate row (name NULL) carrying the
+    # grand total, so one round-trip replaces the separate COUNT query
+    await cursor.execute("""
+        SELECT r.name, COUNT(u.id) as count
+        FROM users u
+        JOIN roles r ON u.role_id = r.id
+        GROUP BY r.name WITH ROLLUP
+    """)
+    rows = await cursor.fetchall()
+
+    by_role = [row for row in rows if row["name"] is not None]
+    total = next((row["count"] for row in rows if row["name"] is None), 0)
+
+    return {
+        "total": total,
+        "by_role": by_role
+    }
+
+
+# SQL for the hot per-ID lookups, built once at import time.
+# aiomysql speaks the text protocol (no server-side prepared statements),
+# so constant query strings are the closest we get to statement reuse.
+GET_USER_SQL = """
+        SELECT
             u.id,
             u.full_name,
             u.email,
@@ -153,184 +350,192 @@ def get_user(user_id: int):
         LEFT JOIN countries c ON u.country_id = c.id
         WHERE u.id = %s
     """
-    
-    cursor.execute(query, (user_id,))
-    user = cursor.fetchone()
-    
-    cursor.close()
-    conn.close()
-    
+
+
+@app.get("/api/users/{user_id}", response_model=UserResponse)
+async def get_user(user_id: int, cursor=Depends(get_db_cursor)):
+    """Get a specific user by ID"""
+    await cursor.execute(GET_USER_SQL, (user_id,))
+    user = await cursor.fetchone()
+
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    return user
 
-
-@app.get("/api/users/count")
-def get_users_count():
-    """Get total count of users"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute("SELECT COUNT(*) as total FROM users")
-    result = cursor.fetchone()
-    
-    cursor.execute("""
-        SELECT r.name, COUNT(u.id) as count 
-        FROM users u 
-        JOIN roles r ON u.role_id = r.id 
-        GROUP BY r.id, r.name
-    """)
-    by_role = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
-    return {
-        "total": result["total"],
-        "by_role": by_role
-    }
+    return user
 
 
 # ============================================
 # ROLES ENDPOINTS
 # ============================================
 
-@app.get("/api/roles", response_model=List[Role])
-def get_roles():
+@app.get("/api/roles", responses={200: {"model": List[Role]}})
+async def get_roles(request: Request):
     """Get all roles"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute("""
-        SELECT id, name, description, view_scope, 
-               can_edit_any_risk, can_delete_risks, has_admin_privileges
-        FROM roles
-        ORDER BY id
-    """)
-    roles = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
-    return roles
+    roles = await cache_get("roles", LOOKUP_TTL)
+    if roles is None:
+        roles = await _fetch_all("""
+            SELECT id, name, description, view_scope,
+                   can_edit_any_risk, can_delete_risks, has_admin_privileges
+            FROM roles
+            ORDER BY id
+        """)
+        # MySQL returns the permission flags as 0/1 tinyints; coerce them
+        # once before caching so the raw response matches the Role model
+        for role in roles:
+            for flag in ("can_edit_any_risk", "can_delete_risks", "has_admin_privileges"):
+                role[flag] = bool(role[flag])
+        await cache_set("roles", roles, LOOKUP_TTL)
+
+    return _conditional_response(request, roles, max_age=LOOKUP_TTL)
 
 
 # ============================================
 # COUNTRIES ENDPOINTS
 # ============================================
 
-@app.get("/api/countries", response_model=List[Country])
-def get_countries():
+@app.get("/api/countries", responses={200: {"model": List[Country]}})
+async def get_countries(request: Request):
     """Get all countries"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute("SELECT id, code, name FROM countries ORDER BY name")
-    countries = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
-    return countries
+    countries = await cache_get("countries", LOOKUP_TTL)
+    if countries is None:
+        countries = await _fetch_all("SELECT id, code, name FROM countries ORDER BY name")
+        await cache_set("countries", countries, LOOKUP_TTL)
+
+    return _conditional_response(request, countries, max_age=LOOKUP_TTL)
 
 
 # ============================================
 # RISKS ENDPOINTS
 # ============================================
 
-@app.get("/api/risks", response_model=List[RiskResponse])
-def get_risks(
+# Cursor markers standing in for a NULL keyset sort key (residual_score
+# and due_date are nullable): emitted in X-Next-Cursor when a page ends
+# on a NULL-keyed row, and recognized on the way back in so the next
+# page resumes inside the NULL region
+NULL_SCORE = -1
+NULL_DUE_DATE = "1000-01-01"
+
+# Columns from the risks table that the API actually returns; shared by
+# the list and detail queries so neither pulls unused fields over the wire
+RISK_COLUMNS = """
+            r.id,
+            r.risk_code,
+            r.title,
+            r.description,
+            r.country_id,
+            r.owner_id,
+            r.inherent_impact,
+            r.inherent_likelihood,
+            r.inherent_score,
+            r.inherent_classification,
+            r.residual_impact,
+            r.residual_likelihood,
+            r.residual_score,
+            r.residual_classification,
+            r.last_review_date,
+            r.created_at"""
+
+
+@app.get("/api/risks", responses={200: {"model": List[RiskResponse]}})
+async def get_risks(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     country_id: Optional[int] = None,
     status_id: Optional[int] = None,
-    classification: Optional[str] = None
+    classification: Optional[str] = None,
+    after_score: Optional[int] = None,
+    after_id: Optional[int] = None,
+    cursor=Depends(get_db_cursor)
 ):
     """
     Get all risks with optional filters
-    
-    - **skip**: Number of records to skip (pagination)
+
+    - **skip**: Number of records to skip (offset pagination)
     - **limit**: Maximum number of records to return
     - **country_id**: Filter by country ID
     - **status_id**: Filter by status ID
     - **classification**: Filter by residual classification (Low, Moderate, Significant)
+    - **after_score** / **after_id**: Keyset cursor (taken from the
+      X-Next-Cursor response header); preferred over skip for deep pages
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    query = """
-        SELECT 
-            r.id,
-            r.risk_code,
-            r.title,
-            r.description,
-            r.country_id,
+    query = f"""
+        SELECT {RISK_COLUMNS},
             c.name as country_name,
             c.code as country_code,
             rr.name as risk_register,
             rf.name as function_area,
             rc.name as category,
-            r.owner_id,
-            u.full_name as owner_name,
             rs.name as status,
-            rt.name as trend,
-            r.inherent_impact,
-            r.inherent_likelihood,
-            r.inherent_score,
-            r.inherent_classification,
-            r.residual_impact,
-            r.residual_likelihood,
-            r.residual_score,
-            r.residual_classification,
-            r.last_review_date,
-            r.created_at
+            rt.name as trend
         FROM risks r
         LEFT JOIN countries c ON r.country_id = c.id
         LEFT JOIN risk_registers rr ON r.risk_register_id = rr.id
         LEFT JOIN risk_functions rf ON r.function_id = rf.id
         LEFT JOIN risk_categories rc ON r.category_id = rc.id
-        LEFT JOIN users u ON r.owner_id = u.id
         LEFT JOIN risk_statuses rs ON r.status_id = rs.id
         LEFT JOIN risk_trends rt ON r.trend_id = rt.id
         WHERE 1=1
     """
     params = []
-    
+
     if country_id is not None:
         query += " AND r.country_id = %s"
         params.append(country_id)
-    
+
     if status_id is not None:
         query += " AND r.status_id = %s"
         params.append(status_id)
-    
+
     if classification is not None:
         query += " AND r.residual_classification = %s"
         params.append(classification)
-    
-    query += " ORDER BY r.residual_score DESC LIMIT %s OFFSET %s"
-    params.extend([limit, skip])
-    
-    cursor.execute(query, params)
-    risks = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
+
+    if after_score is not None and after_id is not None:
+        # Keyset pagination: O(limit) regardless of page depth. The
+        # predicates stay on the bare columns so the indexes from
+        # migrations/001 remain usable; NULL scores sort last in the
+        # DESC order and are entered via the NULL_SCORE cursor marker
+        if after_score == NULL_SCORE:
+            query += " AND r.residual_score IS NULL AND r.id < %s"
+            params.append(after_id)
+        else:
+            query += (" AND (r.residual_score < %s"
+                      " OR (r.residual_score = %s AND r.id < %s)"
+                      " OR r.residual_score IS NULL)")
+            params.extend([after_score, after_score, after_id])
+        query += " ORDER BY r.residual_score DESC, r.id DESC LIMIT %s"
+        params.append(limit)
+    else:
+        query += " ORDER BY r.residual_score DESC, r.id DESC LIMIT %s OFFSET %s"
+        params.extend([limit, skip])
+
+    if limit > STREAM_THRESHOLD:
+        # Large exports: stream from an unbuffered cursor instead of
+        # building the whole list of dicts in memory
+        return StreamingResponse(_stream_rows(query, params, decorate=_add_owner_name),
+                                 media_type="application/json")
+
+    await cursor.execute(query, params)
+    risks = await cursor.fetchall()
+
+    for risk in risks:
+        _add_owner_name(risk)
+
+    if len(risks) == limit:
+        last = risks[-1]
+        last_score = last["residual_score"]
+        response.headers["X-Next-Cursor"] = urlencode(
+            {"after_score": NULL_SCORE if last_score is None else last_score,
+             "after_id": last["id"]})
+
     return risks
 
 
-@app.get("/api/risks/{risk_id}")
-def get_risk(risk_id: int):
-    """Get a specific risk by ID with all details"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    # Get risk details
-    query = """
-        SELECT 
-            r.*,
+# Single round-trip: controls, action plans and comments come back as
+# JSON arrays aggregated by MySQL instead of three extra queries
+GET_RISK_SQL = f"""
+        SELECT {RISK_COLUMNS},
             c.name as country_name,
             c.code as country_code,
             rr.name as risk_register,
@@ -340,7 +545,34 @@ def get_risk(risk_id: int):
             u.full_name as owner_name,
             rs.name as status,
             rt.name as trend,
-            cr.name as controls_rating
+            cr.name as controls_rating,
+            (SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'id', ct.id,
+                'title', ct.title,
+                'description', ct.description,
+                'control_type', ct.control_type,
+                'effectiveness_score', ct.effectiveness_score))
+             FROM controls ct
+             WHERE ct.risk_id = r.id) as controls,
+            (SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'id', ap.id,
+                'title', ap.title,
+                'description', ap.description,
+                'due_date', ap.due_date,
+                'status', ap.status,
+                'priority', ap.priority,
+                'responsible_name', au.full_name))
+             FROM action_plans ap
+             LEFT JOIN users au ON ap.responsible_id = au.id
+             WHERE ap.risk_id = r.id) as action_plans,
+            (SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'id', cm.id,
+                'comment_text', cm.comment_text,
+                'created_at', DATE_FORMAT(cm.created_at, '%%Y-%%m-%%dT%%H:%%i:%%s'),
+                'user_name', cu.full_name))
+             FROM comments cm
+             LEFT JOIN users cu ON cm.user_id = cu.id
+             WHERE cm.risk_id = r.id AND cm.is_internal = 0) as comments
         FROM risks r
         LEFT JOIN countries c ON r.country_id = c.id
         LEFT JOIN risk_registers rr ON r.risk_register_id = rr.id
@@ -353,88 +585,65 @@ def get_risk(risk_id: int):
         LEFT JOIN control_ratings cr ON r.controls_rating_id = cr.id
         WHERE r.id = %s
     """
-    
-    cursor.execute(query, (risk_id,))
-    risk = cursor.fetchone()
-    
+
+
+@app.get("/api/risks/{risk_id}")
+async def get_risk(risk_id: int, cursor=Depends(get_db_cursor)):
+    """Get a specific risk by ID with all details"""
+    await cursor.execute(GET_RISK_SQL, (risk_id,))
+    risk = await cursor.fetchone()
+
     if not risk:
-        cursor.close()
-        conn.close()
         raise HTTPException(status_code=404, detail="Risk not found")
-    
-    # Get controls
-    cursor.execute("""
-        SELECT id, title, description, control_type, effectiveness_score
-        FROM controls WHERE risk_id = %s
-    """, (risk_id,))
-    controls = cursor.fetchall()
-    
-    # Get action plans
-    cursor.execute("""
-        SELECT ap.id, ap.title, ap.description, ap.due_date, ap.status, ap.priority,
-               u.full_name as responsible_name
-        FROM action_plans ap
-        LEFT JOIN users u ON ap.responsible_id = u.id
-        WHERE ap.risk_id = %s
-    """, (risk_id,))
-    action_plans = cursor.fetchall()
-    
-    # Get comments
-    cursor.execute("""
-        SELECT cm.id, cm.comment_text, cm.created_at, u.full_name as user_name
-        FROM comments cm
-        LEFT JOIN users u ON cm.user_id = u.id
-        WHERE cm.risk_id = %s AND cm.is_internal = 0
-        ORDER BY cm.created_at DESC
-    """, (risk_id,))
-    comments = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
-    risk["controls"] = controls
-    risk["action_plans"] = action_plans
-    risk["comments"] = comments
-    
+
+    # The connector returns the aggregated columns as JSON strings
+    # (NULL when the risk has no rows in the child table)
+    for field in ("controls", "action_plans", "comments"):
+        risk[field] = orjson.loads(risk[field]) if risk[field] else []
+
+    # JSON_ARRAYAGG has no deterministic ordering; sort comments newest first
+    risk["comments"].sort(key=lambda cm: cm["created_at"] or "", reverse=True)
+
     return risk
 
 
 @app.get("/api/risks/summary/by-country")
-def get_risks_by_country():
+async def get_risks_by_country(request: Request):
     """Get risk summary by country"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute("""
-        SELECT 
+    summary = await cache_get("by_country", SUMMARY_TTL)
+    if summary is not None:
+        return _conditional_response(request, summary, max_age=SUMMARY_TTL)
+
+    # Reads the materialized risk_summary_by_country table (maintained
+    # by triggers on risks, see migrations/002) instead of aggregating
+    # the whole risks table per request
+    summary = await _fetch_all("""
+        SELECT
             c.code as country_code,
             c.name as country_name,
-            COUNT(r.id) as total_risks,
-            SUM(CASE WHEN r.residual_classification = 'Significant' THEN 1 ELSE 0 END) as significant,
-            SUM(CASE WHEN r.residual_classification = 'Moderate' THEN 1 ELSE 0 END) as moderate,
-            SUM(CASE WHEN r.residual_classification = 'Low' THEN 1 ELSE 0 END) as low,
-            ROUND(AVG(r.residual_score), 1) as avg_residual_score
-        FROM risks r
-        JOIN countries c ON r.country_id = c.id
-        GROUP BY c.id, c.code, c.name
-        ORDER BY total_risks DESC
+            s.total as total_risks,
+            s.significant,
+            s.moderate,
+            s.low,
+            s.avg_score as avg_residual_score
+        FROM risk_summary_by_country s
+        JOIN countries c ON s.country_id = c.id
+        ORDER BY s.total DESC
     """)
-    summary = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
-    return summary
+
+    await cache_set("by_country", summary, SUMMARY_TTL)
+    return _conditional_response(request, summary, max_age=SUMMARY_TTL)
 
 
 @app.get("/api/risks/summary/heatmap")
-def get_risk_heatmap():
+async def get_risk_heatmap():
     """Get risk heatmap data (impact vs likelihood matrix)"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute("""
-        SELECT 
+    heatmap = await cache_get("heatmap", SUMMARY_TTL)
+    if heatmap is not None:
+        return heatmap
+
+    heatmap = await _fetch_all("""
+        SELECT
             residual_impact as impact,
             residual_likelihood as likelihood,
             COUNT(*) as count
@@ -442,11 +651,8 @@ def get_risk_heatmap():
         WHERE status_id != 4
         GROUP BY residual_impact, residual_likelihood
     """)
-    heatmap = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
+
+    await cache_set("heatmap", heatmap, SUMMARY_TTL)
     return heatmap
 
 
@@ -455,17 +661,23 @@ def get_risk_heatmap():
 # ============================================
 
 @app.get("/api/action-plans")
-def get_action_plans(
+async def get_action_plans(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    after_due: Optional[str] = None,
+    after_id: Optional[int] = None,
+    cursor=Depends(get_db_cursor)
 ):
-    """Get all action plans with optional status filter"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
+    """
+    Get all action plans with optional status filter
+
+    - **after_due** / **after_id**: Keyset cursor (taken from the
+      X-Next-Cursor response header); preferred over skip for deep pages
+    """
     query = """
-        SELECT 
+        SELECT
             ap.id,
             ap.title,
             ap.description,
@@ -473,29 +685,51 @@ def get_action_plans(
             ap.status,
             ap.priority,
             ap.completion_date,
+            ap.responsible_id,
             r.risk_code,
-            r.title as risk_title,
-            u.full_name as responsible_name
+            r.title as risk_title
         FROM action_plans ap
         JOIN risks r ON ap.risk_id = r.id
-        JOIN users u ON ap.responsible_id = u.id
         WHERE 1=1
     """
     params = []
-    
+
     if status is not None:
         query += " AND ap.status = %s"
         params.append(status)
-    
-    query += " ORDER BY ap.due_date LIMIT %s OFFSET %s"
-    params.extend([limit, skip])
-    
-    cursor.execute(query, params)
-    plans = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
+
+    if after_due is not None and after_id is not None:
+        # Keyset pagination: O(limit) regardless of page depth. The
+        # predicates stay on the bare columns so the (due_date, id)
+        # index remains usable; NULL due dates sort first in the ASC
+        # order and are paged via the NULL_DUE_DATE cursor marker
+        if after_due == NULL_DUE_DATE:
+            query += (" AND ((ap.due_date IS NULL AND ap.id > %s)"
+                      " OR ap.due_date IS NOT NULL)")
+            params.append(after_id)
+        else:
+            query += (" AND (ap.due_date > %s"
+                      " OR (ap.due_date = %s AND ap.id > %s))")
+            params.extend([after_due, after_due, after_id])
+        query += " ORDER BY ap.due_date, ap.id LIMIT %s"
+        params.append(limit)
+    else:
+        query += " ORDER BY ap.due_date, ap.id LIMIT %s OFFSET %s"
+        params.extend([limit, skip])
+
+    await cursor.execute(query, params)
+    plans = await cursor.fetchall()
+
+    for plan in plans:
+        plan["responsible_name"] = USER_NAMES.get(plan["responsible_id"])
+
+    if len(plans) == limit:
+        last = plans[-1]
+        last_due = last["due_date"]
+        response.headers["X-Next-Cursor"] = urlencode(
+            {"after_due": NULL_DUE_DATE if last_due is None else last_due,
+             "after_id": last["id"]})
+
     return plans
 
 
@@ -504,50 +738,50 @@ def get_action_plans(
 # ============================================
 
 @app.get("/api/dashboard/summary")
-def get_dashboard_summary():
+async def get_dashboard_summary():
     """Get dashboard summary statistics"""
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    # Total risks
-    cursor.execute("SELECT COUNT(*) as total FROM risks WHERE status_id != 4")
-    total_risks = cursor.fetchone()["total"]
-    
-    # Risks by classification
-    cursor.execute("""
-        SELECT residual_classification, COUNT(*) as count
-        FROM risks WHERE status_id != 4
-        GROUP BY residual_classification
-    """)
-    by_classification = {row["residual_classification"]: row["count"] for row in cursor.fetchall()}
-    
-    # Average residual score
-    cursor.execute("SELECT ROUND(AVG(residual_score), 1) as avg FROM risks WHERE status_id != 4")
-    avg_score = cursor.fetchone()["avg"]
-    
-    # Open action plans
-    cursor.execute("SELECT COUNT(*) as total FROM action_plans WHERE status IN ('Open', 'In Progress')")
-    open_actions = cursor.fetchone()["total"]
-    
-    # Overdue action plans
-    cursor.execute("""
-        SELECT COUNT(*) as total FROM action_plans 
-        WHERE status IN ('Open', 'In Progress') AND due_date < CURDATE()
-    """)
-    overdue_actions = cursor.fetchone()["total"]
-    
-    # Total users
-    cursor.execute("SELECT COUNT(*) as total FROM users WHERE is_active = 1")
-    total_users = cursor.fetchone()["total"]
-    
-    cursor.close()
-    conn.close()
-    
-    return {
-        "total_risks": total_risks,
-        "risks_by_classification": by_classification,
-        "average_residual_score": avg_score,
-        "open_action_plans": open_actions,
-        "overdue_action_plans": overdue_actions,
+    cached = await cache_get("dashboard", SUMMARY_TTL)
+    if cached is not None:
+        return cached
+
+    # The three aggregates hit different tables and are independent, so
+    # run them concurrently on separate pool connections: wall time is
+    # the slowest query instead of the sum of all three
+    risk_stats, action_stats, user_stats = await asyncio.gather(
+        # Risk totals, average and per-classification counts in one scan
+        _fetch_one("""
+            SELECT
+                COUNT(CASE WHEN status_id != 4 THEN 1 END) as total_risks,
+                ROUND(AVG(CASE WHEN status_id != 4 THEN residual_score END), 1) as avg_score,
+                SUM(CASE WHEN status_id != 4 AND residual_classification = 'Significant' THEN 1 ELSE 0 END) as significant,
+                SUM(CASE WHEN status_id != 4 AND residual_classification = 'Moderate' THEN 1 ELSE 0 END) as moderate,
+                SUM(CASE WHEN status_id != 4 AND residual_classification = 'Low' THEN 1 ELSE 0 END) as low
+            FROM risks
+        """),
+        # Open and overdue action plans in one pass
+        _fetch_one("""
+            SELECT
+                SUM(CASE WHEN status IN ('Open', 'In Progress') THEN 1 ELSE 0 END) as open_actions,
+                SUM(CASE WHEN status IN ('Open', 'In Progress') AND due_date < CURDATE() THEN 1 ELSE 0 END) as overdue_actions
+            FROM action_plans
+        """),
+        # Total active users
+        _fetch_one("SELECT COUNT(*) as total FROM users WHERE is_active = 1")
+    )
+    total_users = user_stats["total"]
+
+    summary = {
+        "total_risks": risk_stats["total_risks"],
+        "risks_by_classification": {
+            "Significant": int(risk_stats["significant"] or 0),
+            "Moderate": int(risk_stats["moderate"] or 0),
+            "Low": int(risk_stats["low"] or 0)
+        },
+        "average_residual_score": risk_stats["avg_score"],
+        "open_action_plans": int(action_stats["open_actions"] or 0),
+        "overdue_action_plans": int(action_stats["overdue_actions"] or 0),
         "total_active_users": total_users
     }
+
+    await cache_set("dashboard", summary, SUMMARY_TTL)
+    return summary
@@ -0,0 +1,25 @@
+-- Composite indexes matching the filter/sort columns used by the API.
+-- Apply manually against the MySQL database (the app does not run
+-- migrations itself):
+--
+--   mysql -h $DB_HOST -u $DB_USER -p $DB_NAME < migrations/001_add_covering_indexes.sql
+--
+-- Check the /api/risks and /api/users plans with EXPLAIN: the sorts and
+-- keyset seeks should be able to use these indexes (NULL-keyed cursor
+-- pages use OR/IS NULL predicates, which MySQL may serve as a range or
+-- index-merge scan rather than a single seek).
+
+-- /api/risks: filters on country_id/status_id, sorts by residual_score DESC
+CREATE INDEX ix_risks_country_status_score ON risks (country_id, status_id, residual_score DESC, id DESC);
+
+-- /api/risks?classification=...: filter + sort without filesort
+CREATE INDEX ix_risks_class_score ON risks (residual_classification, residual_score DESC, id DESC);
+
+-- /api/users: is_active filter + full_name sort (also serves the keyset cursor)
+CREATE INDEX ix_users_active_name ON users (is_active, full_name, id);
+
+-- /api/risks/{id} child lookups and /api/action-plans due_date sort
+CREATE INDEX ix_ap_risk ON action_plans (risk_id);
+CREATE INDEX ix_ap_due ON action_plans (due_date, id);
+CREATE INDEX ix_controls_risk ON controls (risk_id);
+CREATE INDEX ix_comments_risk_internal_created ON comments (risk_id, is_internal, created_at DESC);
@@ -0,0 +1,65 @@
+-- Materialized per-country risk summary so /api/risks/summary/by-country
+-- reads O(countries) rows instead of aggregating the whole risks table
+-- on every request. Writes to risks (which happen outside this read-only
+-- API) keep it fresh via triggers.
+--
+--   mysql -h $DB_HOST -u $DB_USER -p $DB_NAME < migrations/002_risk_summary_by_country.sql
+
+CREATE TABLE IF NOT EXISTS risk_summary_by_country (
+    country_id INT PRIMARY KEY,
+    total INT NOT NULL,
+    significant INT NOT NULL,
+    moderate INT NOT NULL,
+    low INT NOT NULL,
+    avg_score DECIMAL(4,1),
+    updated_at DATETIME NOT NULL
+);
+
+-- Seed from the current contents of risks
+REPLACE INTO risk_summary_by_country
+SELECT
+    country_id,
+    COUNT(*),
+    SUM(CASE WHEN residual_classification = 'Significant' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN residual_classification = 'Moderate' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN residual_classification = 'Low' THEN 1 ELSE 0 END),
+    ROUND(AVG(residual_score), 1),
+    NOW()
+FROM risks
+GROUP BY country_id;
+
+DELIMITER $$
+
+CREATE PROCEDURE refresh_risk_summary(IN p_country_id INT)
+BEGIN
+    DELETE FROM risk_summary_by_country WHERE country_id = p_country_id;
+    INSERT INTO risk_summary_by_country
+    SELECT
+        country_id,
+        COUNT(*),
+        SUM(CASE WHEN residual_classification = 'Significant' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN residual_classification = 'Moderate' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN residual_classification = 'Low' THEN 1 ELSE 0 END),
+        ROUND(AVG(residual_score), 1),
+        NOW()
+    FROM risks
+    WHERE country_id = p_country_id
+    GROUP BY country_id;
+END$$
+
+CREATE TRIGGER trg_risks_summary_ai AFTER INSERT ON risks
+FOR EACH ROW CALL refresh_risk_summary(NEW.country_id)$$
+
+CREATE TRIGGER trg_risks_summary_au AFTER UPDATE ON risks
+FOR EACH ROW
+BEGIN
+    CALL refresh_risk_summary(NEW.country_id);
+    IF OLD.country_id <> NEW.country_id THEN
+        CALL refresh_risk_summary(OLD.country_id);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_risks_summary_ad AFTER DELETE ON risks
+FOR EACH ROW CALL refresh_risk_summary(OLD.country_id)$$
+
+DELIMITER ;